@@ -1,26 +1,57 @@
-import copy
-import json
+import hashlib
+import logging
 import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Any, AsyncIterator, Awaitable, Callable
 
 import httpx
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse, StreamingResponse, HTMLResponse
+from fastapi.responses import StreamingResponse, HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi import APIRouter
+from starlette.background import BackgroundTask
 
+from fast_json import dumps_bytes, dumps_indented, loads
 from config import get_config, update_config
 
 from parser_control import (
     Parser,
-    build_tool_parser,
+    cached_build_tool_parser,
 )
 from regex_replacement import (
     apply_replacement_to_messages,
     apply_replacement_to_prompt,
 )
 
-app = FastAPI(title="Native Tool Call Adapter for Cline/Roo-Code + GUI")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled client per process so upstream connections are kept alive
+    # and reused across requests instead of being re-established every time.
+    # HTTP/2 is negotiated for https upstreams, multiplexing concurrent
+    # streams over a single connection. Proxies are still taken from the
+    # environment (HTTP_PROXY, HTTPS_PROXY, ALL_PROXY, NO_PROXY).
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        timeout=None,
+    ) as client:
+        app.state.client = client
+        app.state.models_cache = None
+        # The GUI page never changes at runtime; read it once instead of per hit.
+        try:
+            app.state.index_html = Path("web/static/index.html").read_bytes()
+        except FileNotFoundError:
+            app.state.index_html = None
+        yield
+
+
+app = FastAPI(
+    title="Native Tool Call Adapter for Cline/Roo-Code + GUI", lifespan=lifespan
+)
 
 # Mount static files (will add index.html later)
 if os.path.isdir("web/static"):
@@ -28,16 +59,26 @@ if os.path.isdir("web/static"):
 
 api_router = APIRouter(prefix="/api")
 
+# Keep reverse proxies (e.g. nginx) from buffering the event stream.
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+# SSE framing, shared by every emitted event.
+_SSE_PREFIX = b"data: "
+_SSE_SEP = b"\n\n"
+_SSE_DONE_LINE = b"data: [DONE]"
+_SSE_DONE = _SSE_DONE_LINE + _SSE_SEP
+
 
 @api_router.get("/config")
 async def api_get_config():
-    return get_config().model_dump()
+    return get_config().to_dict()
 
 
 @api_router.post("/config")
 async def api_update_config(payload: dict):
     cfg = update_config(payload)
-    return cfg.model_dump()
+    app.state.models_cache = None
+    return cfg.to_dict()
 
 
 @api_router.post("/parse-tools")
@@ -49,60 +90,116 @@ async def api_parse_tools(payload: dict):
     strict_flag = payload.get("strict")
     if strict_flag is None:
         strict_flag = not get_config().disable_strict_schemas
-    parser, new_prompt = build_tool_parser(system_prompt, strict_flag)
+    parser, new_prompt = cached_build_tool_parser(system_prompt, bool(strict_flag))
     return {"processed_system_prompt": new_prompt, "schemas": parser.schemas}
 
 
+@api_router.post("/cache/clear")
+async def api_clear_cache():
+    cached_build_tool_parser.cache_clear()
+    app.state.models_cache = None
+    return {"ok": True}
+
+
+def _pool_stats() -> dict[str, Any]:
+    # httpx does not expose its httpcore pool publicly; degrade to nothing.
+    # Only the direct transport is reported, not any proxy mounts.
+    transport = getattr(app.state.client, "_transport", None)
+    pool = getattr(transport, "_pool", None)
+    if pool is None:
+        return {}
+    connections = pool.connections
+    return {
+        "connections": len(connections),
+        "idle": sum(c.is_idle() for c in connections),
+        # e.g. "'https://host:443', HTTP/2, IDLE, Request Count: 12"
+        "details": [c.info() for c in connections],
+    }
+
+
 @api_router.get("/test-upstream")
 async def api_test_upstream():
-    import time
     cfg = get_config()
     t0 = time.perf_counter()
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            r = await client.get(f"{cfg.target_base_url}/models")
-            latency = (time.perf_counter() - t0) * 1000
-            return {
-                "ok": r.status_code < 400,
-                "status_code": r.status_code,
-                "latency_ms": round(latency, 2),
-            }
+        r = await app.state.client.get(cfg.models_url, timeout=10)
+        latency = (time.perf_counter() - t0) * 1000
+        return {
+            "ok": r.status_code < 400,
+            "status_code": r.status_code,
+            "latency_ms": round(latency, 2),
+            "pool": _pool_stats(),
+        }
     except Exception as e:
         latency = (time.perf_counter() - t0) * 1000
-        return {"ok": False, "error": str(e), "latency_ms": round(latency, 2)}
+        return {
+            "ok": False,
+            "error": str(e),
+            "latency_ms": round(latency, 2),
+            "pool": _pool_stats(),
+        }
 
 app.include_router(api_router)
 
 
 @app.get("/ui")
 async def ui_index():
-    try:
-        with open("web/static/index.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(f.read())
-    except FileNotFoundError:
+    if app.state.index_html is None:
         return HTMLResponse("<h1>GUI not found</h1>", status_code=404)
+    return HTMLResponse(app.state.index_html)
+
+
+# Debug dumps are written by one background thread, in submission order, so
+# that disk I/O never blocks the event loop.
+_dump_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dump")
+logger = logging.getLogger(__name__)
+
+
+def _write_json_dump(path: str, obj: Any):
+    with open(path, "wb") as f:
+        f.write(dumps_indented(obj))
+
+
+def _write_text_dump(path: str, text: str):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _log_dump_error(fut: Future):
+    if (exc := fut.exception()) is not None:
+        logger.error("Failed to write debug dump", exc_info=exc)
+
+
+def _submit_dump(write: Callable[..., None], path: str, data: Any):
+    _dump_executor.submit(write, path, data).add_done_callback(_log_dump_error)
 
 
 def process_request(
     request: dict[str, Any],
 ) -> tuple[dict[str, Any], Parser, Callable[[str], str]]:
-    request = copy.deepcopy(request)
+    # Only the top-level request, the message list and the first message are
+    # rewritten here; everything nested is copied by the converters below.
+    request = dict(request)
+    request["messages"] = list(request["messages"])
     cfg = get_config()
     if request["messages"] and request["messages"][0]["role"] in ["system", "user"]:
         system_prompt = request["messages"][0]["content"]
         if isinstance(system_prompt, list):
+            # Decoded JSON only yields plain dicts/strs, so exact type checks
+            # suffice; non-string text parts are skipped.
             system_prompt = "\n".join(
-                [
-                    str(t["text"])
-                    for t in system_prompt
-                    if isinstance(t, dict) and "text" in t
-                ]
+                t["text"]
+                for t in system_prompt
+                if type(t) is dict and type(t.get("text")) is str
             )
-        parser, processed_system_prompt = build_tool_parser(
+        parser, processed_system_prompt = cached_build_tool_parser(
             system_prompt, not cfg.disable_strict_schemas
         )
-        request["messages"][0]["role"] = "system"
-        request["messages"][0]["content"] = processed_system_prompt
+        request["messages"][0] = {
+            **request["messages"][0],
+            "role": "system",
+            "content": processed_system_prompt,
+        }
         if parser.schemas:
             request["tools"] = (request.get("tools") or []) + parser.schemas
         if cfg.force_tool_calling and request.get("tools"):
@@ -114,151 +211,288 @@ def process_request(
     )
 
     if cfg.message_dump_path:
-        with open(cfg.message_dump_path, "w", encoding="utf-8") as f:
-            json.dump(request["messages"], f, ensure_ascii=False, indent=2)
+        _submit_dump(
+            _write_json_dump, cfg.message_dump_path, request["messages"]
+        )
     if cfg.tool_dump_path:
-        with open(cfg.tool_dump_path, "w", encoding="utf-8") as f:
-            json.dump((request.get("tools") or "[]"), f, ensure_ascii=False, indent=2)
+        _submit_dump(
+            _write_json_dump, cfg.tool_dump_path, request.get("tools") or "[]"
+        )
 
     return request, parser, apply_replacement_to_completion
 
 
+def _data_lines(event: bytes) -> list[bytes]:
+    if b"\n" not in event:
+        return [event] if event.startswith(_SSE_PREFIX) else []
+    return [line for line in event.split(b"\n") if line.startswith(_SSE_PREFIX)]
+
+
+def _normalize_newlines(pending: bytearray, final: bool) -> bytearray:
+    # SSE allows CRLF and bare CR line endings; map both to LF. Unless the
+    # stream has ended, a trailing CR is held back as it may be the first
+    # half of a CRLF split across chunks.
+    held = not final and pending.endswith(b"\r")
+    if held:
+        del pending[-1:]
+    pending = pending.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    if held:
+        pending += b"\r"
+    return pending
+
+
+async def _aiter_data_lines(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Yield the raw ``data: ...`` lines of an upstream SSE stream.
+
+    The byte stream is scanned for blank-line event boundaries without being
+    decoded; comments and other fields are dropped.
+    """
+    pending = bytearray()
+    async for chunk in response.aiter_bytes():
+        pending += chunk
+        if b"\r" in pending:
+            pending = _normalize_newlines(pending, final=False)
+        start = 0
+        while (end := pending.find(_SSE_SEP, start)) != -1:
+            for line in _data_lines(bytes(pending[start:end])):
+                yield line
+            start = end + 2
+        del pending[:start]
+    pending = _normalize_newlines(pending, final=True)
+    for line in _data_lines(bytes(pending.strip())):
+        yield line
+
+
+# Headers that describe this hop rather than the upstream request.
+_HOP_HEADERS = frozenset(
+    {"host", "content-length", "connection", "keep-alive", "transfer-encoding"}
+)
+
+
+def _forward_headers(request: Request) -> dict[str, str]:
+    return {k: v for k, v in request.headers.items() if k not in _HOP_HEADERS}
+
+
+async def _open_stream(
+    url: str, payload: dict[str, Any], headers: dict[str, str], params: Any
+) -> httpx.Response:
+    """POST to the upstream and return the response with its body unread.
+
+    The caller must release it, see ``_close_after``.
+    """
+    client: httpx.AsyncClient = app.state.client
+    upstream_request = client.build_request(
+        "POST", url, json=payload, headers=headers, params=params
+    )
+    return await client.send(upstream_request, stream=True)
+
+
+async def _close_after(
+    response: httpx.Response, chunks: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    """Yield from a stream handler, closing the upstream response however it ends.
+
+    Starlette skips a response's background task when the body iterator
+    raises, so the close cannot rely on that alone.
+    """
+    try:
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await response.aclose()
+
+
 async def handle_stream_response(
     response: httpx.Response,
     parser: Parser,
     apply_replacement_to_completion: Callable[[str], str],
     is_disconnected: Callable[[], Awaitable[bool]],
-) -> AsyncIterator[str]:
+) -> AsyncIterator[bytes]:
     if response.is_error:
         await response.aread()
-        yield f"data: {response.text}\n\n"
-        yield "data: [DONE]\n\n"
+        yield _SSE_PREFIX + response.content + _SSE_SEP
+        yield _SSE_DONE
         return
-    buffer = ""
+    # Streamed fragments are collected in lists and joined once per tool call;
+    # only non-empty fragments are appended so the lists' truthiness matches
+    # "something has been received".
+    buffer_parts: list[str] = []
     last_chunk = None
     role = None
     choice_index = 0
     tool_call_index = 0
-    tool_call_id = ""
-    tool_name = ""
-    reasoning_content_buffer = ""
-    async for line in response.aiter_lines():
+    tool_call_id_parts: list[str] = []
+    tool_name_parts: list[str] = []
+    reasoning_content_parts: list[str] = []
+
+    def create_tool_call():
+        modified_data = parser.modify_tool_call_to_xml_message(
+            "".join(tool_name_parts),
+            "".join(buffer_parts),
+            "".join(tool_call_id_parts),
+            "".join(reasoning_content_parts),
+        )
+        modified_data = apply_replacement_to_completion(modified_data)
+        last_chunk["choices"][0]["delta"]["content"] = modified_data
+        buffer_parts.clear()
+        tool_name_parts.clear()
+        tool_call_id_parts.clear()
+        reasoning_content_parts.clear()
+        return _SSE_PREFIX + dumps_bytes(last_chunk) + _SSE_SEP
+
+    async for line in _aiter_data_lines(response):
         if await is_disconnected():
             return
-        if not line.startswith("data: "):
+        if (
+            not buffer_parts
+            and b'"tool_calls"' not in line
+            and b'"reasoning_content"' not in line
+            and b'"role"' not in line
+        ):
+            # Nothing to convert and no state to track: forward it untouched.
+            yield line + _SSE_SEP
             continue
-
-        def create_tool_call():
-            nonlocal buffer, tool_name, tool_call_id, reasoning_content_buffer
-            modified_data = parser.modify_tool_call_to_xml_message(
-                tool_name, buffer, tool_call_id, reasoning_content_buffer
-            )
-            modified_data = apply_replacement_to_completion(modified_data)
-            last_chunk["choices"][0]["delta"]["content"] = modified_data
-            buffer = ""
-            tool_name = ""
-            tool_call_id = ""
-            reasoning_content_buffer = ""
-            return f"data: {json.dumps(last_chunk, ensure_ascii=False)}\n\n"
-
-        if line.strip() == "data: [DONE]":
-            if buffer:
+        if line.rstrip() == _SSE_DONE_LINE:
+            if buffer_parts:
                 yield create_tool_call()
-            yield line + "\n\n"
+            yield _SSE_DONE
             continue
-        data = json.loads(line[6:].strip())
+        data = loads(line[6:])
         choice = (data.get("choices") or [{}])[0]
         choice_index_of_delta = choice.get("index", choice_index)
         delta = choice.get("delta") or {}
+        if (
+            not buffer_parts
+            and not delta.get("tool_calls")
+            and not delta.get("reasoning_content")
+            and data.get("finish_reason") != "tool_calls"
+        ):
+            # Plain delta: only the choice/role bookkeeping needs updating.
+            choice_index = choice_index_of_delta
+            role = delta.get("role", role)
+            yield line + _SSE_SEP
+            continue
         role_in_delta = delta.get("role", role)
         tool_calls_in_delta = delta.get("tool_calls")
-        reasoning_content_buffer += delta.get("reasoning_content") or ""
+        if reasoning_content := delta.get("reasoning_content"):
+            reasoning_content_parts.append(reasoning_content)
         if (
             choice_index_of_delta != choice_index
             or not delta
             or role_in_delta != role
             or not tool_calls_in_delta
-        ) and buffer:
+        ) and buffer_parts:
             yield create_tool_call()
         choice_index = choice_index_of_delta
         role = role_in_delta
         if role == "assistant":
             tool_call = (tool_calls_in_delta or [{}])[0]
-            if tool_call.get("index") != tool_call_index and buffer:
+            if tool_call.get("index") != tool_call_index and buffer_parts:
                 yield create_tool_call()
             if tool_call:
-                tool_name += tool_call.get("function").get("name", "")
-                buffer += tool_call.get("function").get("arguments", "")
-                tool_call_id += tool_call.get("id", "")
+                function = tool_call.get("function")
+                if name := function.get("name"):
+                    tool_name_parts.append(name)
+                if arguments := function.get("arguments"):
+                    buffer_parts.append(arguments)
+                if tool_call_id := tool_call.get("id"):
+                    tool_call_id_parts.append(tool_call_id)
                 tool_call_index = tool_call.get("index", tool_call_index)
                 last_chunk = data
-        if data.get("finish_reason") and buffer:
+        if data.get("finish_reason") and buffer_parts:
             yield create_tool_call()
         if data.get("finish_reason") == "tool_calls":
             data["finish_reason"] = "stop"
-        yield "data: " + json.dumps(data, ensure_ascii=False) + "\n\n"
+        yield _SSE_PREFIX + dumps_bytes(data) + _SSE_SEP
 
 
 @app.post("/v1/chat/completions")
 async def create_completion(request: Request):
+    cfg = get_config()
     modified_request, parser, apply_replacement_to_completion = process_request(
-        await request.json()
+        loads(await request.body())
     )
 
-    headers = dict(request.headers)
-    if "host" in headers:
-        del headers["host"]
-    if "content-length" in headers:
-        del headers["content-length"]
+    headers = _forward_headers(request)
     stream = modified_request.get("stream")
     if stream:
-
-        async def create_event_stream() -> AsyncIterator[str]:
-            async with httpx.AsyncClient(timeout=None) as client:
-                async with client.stream(
-                    "POST",
-                    f"{get_config().target_base_url}/chat/completions",
-                    json=modified_request,
-                    headers=headers,
-                    params=request.query_params,
-                ) as r:
-                    async for iter in handle_stream_response(
-                        r,
-                        parser,
-                        apply_replacement_to_completion,
-                        request.is_disconnected,
-                    ):
-                        yield iter
-
-        return StreamingResponse(create_event_stream(), media_type="text/event-stream")
+        r = await _open_stream(
+            cfg.chat_completions_url, modified_request, headers, request.query_params
+        )
+        return StreamingResponse(
+            _close_after(
+                r,
+                handle_stream_response(
+                    r,
+                    parser,
+                    apply_replacement_to_completion,
+                    request.is_disconnected,
+                ),
+            ),
+            media_type="text/event-stream",
+            headers=_SSE_HEADERS,
+            # Still closes the response if the body is never iterated.
+            background=BackgroundTask(r.aclose),
+        )
     else:
-        async with httpx.AsyncClient(timeout=None) as client:
-            r = await client.post(
-                f"{get_config().target_base_url}/chat/completions",
-                json=modified_request,
-                headers=headers,
-                params=request.query_params,
-            )
-            if r.is_error:
-                return JSONResponse(status_code=r.status_code, content=r.json())
-            modified_response = parser.modify_tool_calls_to_xml_messages(
-                r.json(), apply_replacement_to_completion
-            )
-            return JSONResponse(status_code=r.status_code, content=modified_response)
+        r = await app.state.client.post(
+            cfg.chat_completions_url,
+            json=modified_request,
+            headers=headers,
+            params=request.query_params,
+        )
+        if r.is_error:
+            return Response(r.content, r.status_code, media_type="application/json")
+        modified_response = parser.modify_tool_calls_to_xml_messages(
+            loads(r.content), apply_replacement_to_completion
+        )
+        return Response(
+            dumps_bytes(modified_response),
+            r.status_code,
+            media_type="application/json",
+        )
+
+
+# Model lists change rarely but clients poll them, so successful upstream
+# responses are reused for a short while.
+_MODELS_CACHE_TTL = 30.0
+# Headers that identify the caller upstream; responses are only shared
+# between requests that present the same values for all of them.
+_CREDENTIAL_HEADERS = ("authorization", "api-key", "x-api-key")
+
+
+def _credentials_digest(headers: dict[str, str]) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    for name in _CREDENTIAL_HEADERS:
+        value = headers.get(name)
+        h.update(b"\0" if value is None else b"\1" + value.encode() + b"\0")
+    return h.digest()
 
 
 @app.get("/v1/models")
 async def get_models(request: Request):
-    headers = dict(request.headers)
-    if "host" in headers:
-        del headers["host"]
-    if "content-length" in headers:
-        del headers["content-length"]
-    async with httpx.AsyncClient(timeout=None) as client:
-        r = await client.get(
-            f"{get_config().target_base_url}/models", headers=headers, params=request.query_params
+    headers = _forward_headers(request)
+    cfg = get_config()
+    key = (
+        cfg.models_url,
+        str(request.query_params),
+        _credentials_digest(headers),
+    )
+    cached = app.state.models_cache
+    if cached and cached[0] == key and time.monotonic() < cached[1]:
+        _, _, content, status_code = cached
+        return Response(content, status_code, media_type="application/json")
+    r = await app.state.client.get(
+        cfg.models_url, headers=headers, params=request.query_params
+    )
+    if not r.is_error:
+        app.state.models_cache = (
+            key,
+            time.monotonic() + _MODELS_CACHE_TTL,
+            r.content,
+            r.status_code,
         )
-        return JSONResponse(status_code=r.status_code, content=r.json())
+    return Response(r.content, r.status_code, media_type="application/json")
 
 
 # Legacy/alternate path some clients request
@@ -271,95 +505,85 @@ async def handle_stream_response_for_legacy_completion(
     response: httpx.Response,
     apply_replacement_to_completion: Callable[[str], str],
     is_disconnected: Callable[[], Awaitable[bool]],
-) -> AsyncIterator[str]:
+) -> AsyncIterator[bytes]:
     if response.is_error:
         await response.aread()
-        yield f"data: {response.text}\n\n"
-        yield "data: [DONE]\n\n"
+        yield _SSE_PREFIX + response.content + _SSE_SEP
+        yield _SSE_DONE
         return
-    buffer = ""
+    buffer_parts: list[str] = []
     last_chunk = None
     choice_index = 0
-    async for line in response.aiter_lines():
-        if await is_disconnected():
-            return
-        if not line.startswith("data: "):
-            continue
 
-        def create_tool_call():
-            nonlocal buffer
-            modified_data = apply_replacement_to_completion(buffer)
-            last_chunk["choices"][0]["text"] = modified_data
-            buffer = ""
-            return f"data: {json.dumps(last_chunk, ensure_ascii=False)}\n\n"
+    def create_tool_call():
+        modified_data = apply_replacement_to_completion("".join(buffer_parts))
+        last_chunk["choices"][0]["text"] = modified_data
+        buffer_parts.clear()
+        return _SSE_PREFIX + dumps_bytes(last_chunk) + _SSE_SEP
 
-        if line.strip() == "data: [DONE]":
-            if buffer:
+    async for line in _aiter_data_lines(response):
+        if await is_disconnected():
+            return
+        if line.rstrip() == _SSE_DONE_LINE:
+            if buffer_parts:
                 yield create_tool_call()
-            yield line + "\n\n"
+            yield _SSE_DONE
             continue
-        data = json.loads(line[6:].strip())
+        data = loads(line[6:])
         choice = (data.get("choices") or [{}])[0]
         text = choice.get("text") or ""
         choice_index_of_delta = choice.get("index", choice_index)
-        if (not text or choice_index_of_delta != choice_index) and buffer:
+        if (not text or choice_index_of_delta != choice_index) and buffer_parts:
             yield create_tool_call()
         choice_index = choice_index_of_delta
         if text:
-            buffer += text
+            buffer_parts.append(text)
             last_chunk = data
-        if data.get("finish_reason") and buffer:
+        if data.get("finish_reason") and buffer_parts:
             yield create_tool_call()
         choice["text"] = ""
-        yield "data: " + json.dumps(data, ensure_ascii=False) + "\n\n"
+        yield _SSE_PREFIX + dumps_bytes(data) + _SSE_SEP
 
 
 @app.post("/v1/completions")
 async def create_legacy_completion(request: Request):
-    req = await request.json()
+    req = loads(await request.body())
     req["prompt"], apply_replacement_to_completion = apply_replacement_to_prompt(
         req["prompt"]
     )
     cfg = get_config()
     if cfg.message_dump_path:
-        with open(cfg.message_dump_path, "w", encoding="utf-8") as f:
-            f.write(req["prompt"])
-
-    headers = dict(request.headers)
-    if "host" in headers:
-        del headers["host"]
-    if "content-length" in headers:
-        del headers["content-length"]
+        _submit_dump(_write_text_dump, cfg.message_dump_path, req["prompt"])
+
+    headers = _forward_headers(request)
     stream = req.get("stream")
     if stream:
-
-        async def create_event_stream() -> AsyncIterator[str]:
-            async with httpx.AsyncClient(timeout=None) as client:
-                async with client.stream(
-                    "POST",
-                    f"{get_config().target_base_url}/completions",
-                    json=req,
-                    headers=headers,
-                    params=request.query_params,
-                ) as r:
-                    async for iter in handle_stream_response_for_legacy_completion(
-                        r, apply_replacement_to_completion, request.is_disconnected
-                    ):
-                        yield iter
-
-        return StreamingResponse(create_event_stream(), media_type="text/event-stream")
+        r = await _open_stream(cfg.completions_url, req, headers, request.query_params)
+        return StreamingResponse(
+            _close_after(
+                r,
+                handle_stream_response_for_legacy_completion(
+                    r, apply_replacement_to_completion, request.is_disconnected
+                ),
+            ),
+            media_type="text/event-stream",
+            headers=_SSE_HEADERS,
+            # Still closes the response if the body is never iterated.
+            background=BackgroundTask(r.aclose),
+        )
     else:
-        async with httpx.AsyncClient(timeout=None) as client:
-            r = await client.post(
-                f"{get_config().target_base_url}/completions",
-                json=req,
-                headers=headers,
-                params=request.query_params,
-            )
-            if r.is_error:
-                return JSONResponse(status_code=r.status_code, content=r.json())
-            response = r.json()
-            for choice in response.get("choices", []):
-                text = choice.get("text", "")
-                choice["text"] = apply_replacement_to_completion(text)
-            return JSONResponse(status_code=r.status_code, content=response)
+        r = await app.state.client.post(
+            cfg.completions_url,
+            json=req,
+            headers=headers,
+            params=request.query_params,
+        )
+        if r.is_error:
+            return Response(r.content, r.status_code, media_type="application/json")
+        response = loads(r.content)
+        for choice in response.get("choices", []):
+            text = choice.get("text", "")
+            choice["text"] = apply_replacement_to_completion(text)
+        return Response(
+            dumps_bytes(response), r.status_code, media_type="application/json"
+        )
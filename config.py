@@ -1,14 +1,31 @@
 from __future__ import annotations
+import dataclasses
 import os
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from typing import Optional
 
-class RuntimeConfig(BaseModel):
-    target_base_url: str = Field(default_factory=lambda: os.getenv("TARGET_BASE_URL", "https://api.openai.com/v1"))
-    message_dump_path: Optional[str] = Field(default_factory=lambda: os.getenv("MESSAGE_DUMP_PATH"))
-    tool_dump_path: Optional[str] = Field(default_factory=lambda: os.getenv("TOOL_DUMP_PATH"))
-    disable_strict_schemas: bool = Field(default_factory=lambda: bool(os.getenv("DISABLE_STRICT_SCHEMAS")))
-    force_tool_calling: bool = Field(default_factory=lambda: bool(os.getenv("FORCE_TOOL_CALLING")))
+@dataclass(slots=True, frozen=True)
+class RuntimeConfig:
+    target_base_url: str = field(default_factory=lambda: os.getenv("TARGET_BASE_URL", "https://api.openai.com/v1"))
+    message_dump_path: Optional[str] = field(default_factory=lambda: os.getenv("MESSAGE_DUMP_PATH"))
+    tool_dump_path: Optional[str] = field(default_factory=lambda: os.getenv("TOOL_DUMP_PATH"))
+    disable_strict_schemas: bool = field(default_factory=lambda: bool(os.getenv("DISABLE_STRICT_SCHEMAS")))
+    force_tool_calling: bool = field(default_factory=lambda: bool(os.getenv("FORCE_TOOL_CALLING")))
+    # Upstream endpoints derived from target_base_url, joined once per config
+    # snapshot instead of on every request.
+    chat_completions_url: str = field(init=False, repr=False)
+    completions_url: str = field(init=False, repr=False)
+    models_url: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "chat_completions_url", f"{self.target_base_url}/chat/completions")
+        object.__setattr__(self, "completions_url", f"{self.target_base_url}/completions")
+        object.__setattr__(self, "models_url", f"{self.target_base_url}/models")
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in _CONFIG_FIELDS}
+
+_CONFIG_FIELDS = tuple(f.name for f in dataclasses.fields(RuntimeConfig) if f.init)
 
 _global_config: RuntimeConfig | None = None
 
@@ -23,6 +40,8 @@ def get_config() -> RuntimeConfig:
 def update_config(data: dict) -> RuntimeConfig:
     global _global_config
     current = get_config()
-    merged = current.model_copy(update=data)
+    merged = dataclasses.replace(
+        current, **{k: v for k, v in data.items() if k in _CONFIG_FIELDS}
+    )
     _global_config = merged
     return merged
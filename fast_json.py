@@ -0,0 +1,31 @@
+"""JSON encode/decode helpers for the request/response hot paths.
+
+Uses orjson when it is installed and falls back to the stdlib ``json`` module
+otherwise. Both backends emit non-ASCII characters as-is (UTF-8).
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def loads(data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # pragma: no cover - exercised only without orjson
+    import json
+
+    def loads(data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode()
@@ -33,6 +33,14 @@ import re
 from pathlib import Path
 from typing import List
 
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ModuleNotFoundError:
+        tomllib = None
+
 PYPROJECT = Path(__file__).parent / "pyproject.toml"
 
 COLOR = sys.stdout.isatty()
@@ -52,22 +60,26 @@ def error(msg: str):
     print(c('31', '[ERROR]'), msg)
 
 def parse_dependencies(pyproject_text: str) -> List[str]:
-    # Simple extraction of dependencies = [ ... ] block under [project]
-    # This is intentionally lightweight to avoid adding toml dependency.
-    m = re.search(r"^dependencies\s*=\s*\[(?P<body>[\s\S]*?)\]", pyproject_text, re.MULTILINE)
+    # [project].dependencies; handles comments, multi-line arrays and extras
+    if tomllib is None:
+        return _parse_dependencies_without_toml(pyproject_text)
+    return tomllib.loads(pyproject_text).get('project', {}).get('dependencies', [])
+
+def _parse_dependencies_without_toml(pyproject_text: str) -> List[str]:
+    # Fallback for interpreters without tomllib/tomli: collect the quoted
+    # strings of the dependencies array, stopping at the first unquoted ']'
+    # so extras such as "httpx[http2]" are kept intact.
+    m = re.search(r"^dependencies\s*=\s*\[", pyproject_text, re.MULTILINE)
     if not m:
         return []
-    body = m.group('body')
     deps = []
-    for line in body.splitlines():
-        line = line.strip().rstrip(',')
-        if not line or line.startswith('#'):
-            continue
-        # Remove wrapping quotes
-        if (line.startswith('"') and line.endswith('"')) or (line.startswith("'") and line.endswith("'")):
-            line = line[1:-1]
-        if line:
-            deps.append(line)
+    token = re.compile(r'"([^"]*)"|\'([^\']*)\'|#[^\n]*|(\])')
+    for t in token.finditer(pyproject_text, m.end()):
+        if t.group(3):
+            break
+        dep = t.group(1) if t.group(1) is not None else t.group(2)
+        if dep:
+            deps.append(dep)
     return deps
 
 def ensure_venv(venv_dir: Path, python_exe: str | None, fresh: bool = False) -> Path:
@@ -2,6 +2,7 @@ import copy
 import json
 import re
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 from typing import Any, Callable
 
 from extra_parser import (
@@ -290,3 +291,12 @@ def build_tool_parser(system_prompt: str, strict: bool = True) -> tuple[Parser,
             new_system_prompt = new_system_prompt.replace(x, json_example)
 
     return parser, new_system_prompt
+
+
+@lru_cache(maxsize=128)
+def cached_build_tool_parser(
+    system_prompt: str, strict: bool = True
+) -> tuple[Parser, str]:
+    # Clients resend the same system prompt every turn. A Parser is never
+    # mutated after construction, so the cached instance can be shared.
+    return build_tool_parser(system_prompt, strict)